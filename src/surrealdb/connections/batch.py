@@ -0,0 +1,161 @@
+"""
+Collects several operations and sends them to the database as a single multi-statement query.
+"""
+
+from typing import Any, Optional, Union
+
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.data.types.table import Table
+from surrealdb.data.utils import process_thing
+from surrealdb.request_message.message import RequestMessage
+from surrealdb.request_message.methods import RequestMethod
+
+
+class Batch:
+    """
+    Accumulates operations and executes them in one round trip. Results are returned in the
+    order the operations were added.
+
+    Example:
+        with db.batch() as batch:
+            batch.create("person:tobie", {"name": "Tobie"})
+            batch.select("person")
+        tobie, people = batch.results
+
+    Attributes:
+        connection: The connection the batch is sent through.
+        statements: The SurrealQL statements queued so far.
+        params: The parameters bound to the queued statements.
+        results: The results of the last call to `execute`.
+    """
+
+    def __init__(self, connection) -> None:
+        """
+        The constructor for the Batch class.
+
+        :param connection: the connection to send the batch through.
+        """
+        self.connection = connection
+        self.statements: list[str] = []
+        self.params: dict[str, Any] = dict()
+        self.results: Optional[list[Any]] = None
+
+    def _param(self, key: str, value: Any) -> str:
+        name = f"_batch{len(self.statements)}_{key}"
+        self.params[name] = value
+        return name
+
+    def _target(self, thing: Union[str, RecordID, Table]) -> str:
+        what = process_thing(thing)
+        name = self._param("what", what)
+        if isinstance(what, RecordID):
+            return f"ONLY ${name}"
+        return f"${name}"
+
+    def query(self, query: str, vars: Optional[dict] = None) -> None:
+        """
+        Queue a single SurrealQL statement.
+
+        `query` must hold exactly one statement: each extra statement adds its own entry to
+        `results` and shifts every later one. `vars` is shared by the whole batch, so binding
+        a name that an earlier statement already bound to a different value raises.
+
+        :param query: (str) the SurrealQL statement.
+        :param vars: (dict) the parameters bound to the statement.
+        """
+        for key, value in (vars or dict()).items():
+            if key in self.params and self.params[key] != value:
+                raise ValueError(
+                    f"batch parameter ${key} is already bound to a different value"
+                )
+        if vars:
+            self.params.update(vars)
+        self.statements.append(query.strip().rstrip(";"))
+
+    def select(self, thing: Union[str, RecordID, Table]) -> None:
+        target = self._target(thing)
+        self.statements.append(f"SELECT * FROM {target}")
+
+    def create(
+        self,
+        thing: Union[str, RecordID, Table],
+        data: Optional[dict] = None,
+    ) -> None:
+        name = self._param("what", process_thing(thing))
+        if data is None:
+            self.statements.append(f"CREATE ONLY ${name}")
+        else:
+            content = self._param("data", data)
+            self.statements.append(f"CREATE ONLY ${name} CONTENT ${content}")
+
+    def update(
+        self, thing: Union[str, RecordID, Table], data: Optional[dict] = None
+    ) -> None:
+        target = self._target(thing)
+        if data is None:
+            self.statements.append(f"UPDATE {target}")
+        else:
+            content = self._param("data", data)
+            self.statements.append(f"UPDATE {target} CONTENT ${content}")
+
+    def merge(
+        self, thing: Union[str, RecordID, Table], data: Optional[dict] = None
+    ) -> None:
+        target = self._target(thing)
+        content = self._param("data", data or dict())
+        self.statements.append(f"UPDATE {target} MERGE ${content}")
+
+    def upsert(
+        self, thing: Union[str, RecordID, Table], data: Optional[dict] = None
+    ) -> None:
+        target = self._target(thing)
+        if data is None:
+            self.statements.append(f"UPSERT {target}")
+        else:
+            content = self._param("data", data)
+            self.statements.append(f"UPSERT {target} CONTENT ${content}")
+
+    def delete(self, thing: Union[str, RecordID, Table]) -> None:
+        target = self._target(thing)
+        self.statements.append(f"DELETE {target} RETURN BEFORE")
+
+    def execute(self) -> list[Any]:
+        """
+        Sends every queued statement in a single query and clears the queue.
+
+        The batch is not transactional: each statement is applied on its own, so one that fails
+        does not undo the others. The queue is cleared before sending, so calling `execute`
+        again never re-applies statements, and when a statement fails `results` holds the
+        results of the statements before it.
+
+        :return: (list) the result of each statement, in the order they were queued.
+        """
+        if not self.statements:
+            self.results = []
+            return self.results
+        message = RequestMessage(
+            RequestMethod.QUERY,
+            query=";\n".join(self.statements),
+            params={**self.connection.vars, **self.params},
+        )
+        self.statements = []
+        self.params = dict()
+        self.results = []
+        self.connection.id = message.id
+        response = self.connection._send(message, "batch")
+        self.connection.check_response_for_result(response, "batch")
+
+        for index, outcome in enumerate(response["result"]):
+            if outcome.get("status") == "ERR":
+                raise Exception(
+                    f"batch statement {index} failed: {outcome.get('result')}"
+                )
+            self.results.append(outcome.get("result"))
+        return self.results
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None and self.statements:
+            self.execute()
@@ -1,62 +1,196 @@
-import uuid
-from typing import Any, Optional, Union, cast
+import io
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 
+from surrealdb.connections.batch import Batch
 from surrealdb.connections.sync_template import SyncTemplate
 from surrealdb.connections.url import Url
 from surrealdb.connections.utils_mixin import UtilsMixin
-from surrealdb.data.cbor import decode
+from surrealdb.data.cbor import decode, decode_stream
 from surrealdb.data.types.record_id import RecordID
 from surrealdb.data.types.table import Table
 from surrealdb.request_message.message import RequestMessage
 from surrealdb.request_message.methods import RequestMethod
+from surrealdb.request_message.prepared import PreparedQuery
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 
 class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
-    def __init__(self, url: str) -> None:
+    __slots__ = (
+        "url",
+        "raw_url",
+        "host",
+        "port",
+        "token",
+        "id",
+        "namespace",
+        "database",
+        "vars",
+        "session",
+        "_rpc_url",
+        "_httpx",
+        "_pool_maxsize",
+        "_post",
+        "__weakref__",
+    )
+
+    _base_headers = {
+        "Accept": "application/cbor",
+        "Content-Type": "application/cbor",
+        "Accept-Encoding": "identity",
+    }
+
+    def __init__(
+        self, url: str, transport: str = "requests", pool_maxsize: int = 20
+    ) -> None:
+        """
+        The constructor for the BlockingHttpSurrealConnection class.
+
+        :param url: (str) the URL of the database to process queries for.
+        :param transport: (str) "requests" (default) for HTTP/1.1 keep-alive, or "httpx" to
+            multiplex requests over HTTP/2. The latter needs the `httpx` extra, and HTTP/2 is
+            only negotiated over `https://` URLs; over `http://` it falls back to HTTP/1.1.
+            Failed connects are retried on both transports, but only the requests transport
+            retries 503 responses. Errors are raised as `requests` exceptions either way.
+        :param pool_maxsize: (int) the number of connections kept open to the server. This
+            also caps the number of worker threads used by `map`.
+        """
         self.url: Url = Url(url)
         self.raw_url: str = url.rstrip("/")
         self.host: Optional[str] = self.url.hostname
         self.port: Optional[int] = self.url.port
         self.token: Optional[str] = None
-        self.id: str = str(uuid.uuid4())
+        # the id of the last request message, set on the first RPC
+        self.id: Optional[str] = None
         self.namespace: Optional[str] = None
         self.database: Optional[str] = None
         self.vars: dict[str, Any] = dict()
+        self._rpc_url: str = f"{self.url.raw_url}/rpc"
+        self._httpx: bool = transport == "httpx"
+        if self._httpx:
+            self.session = self._httpx_client(pool_maxsize=pool_maxsize)
+        elif transport == "requests":
+            self.session = requests.Session()
+            self._mount_adapter(pool_maxsize=pool_maxsize)
+            self.session.headers.update(self._base_headers)
+        else:
+            raise ValueError(
+                f"Unsupported transport: {transport}. Use 'requests' or 'httpx'."
+            )
+        self._post = self.session.post
+
+    def _httpx_client(self, pool_maxsize: int):
+        if httpx is None:
+            raise ImportError(
+                'the httpx transport requires the httpx extra: pip install "surrealdb[httpx]"'
+            )
+        self._pool_maxsize = pool_maxsize
+        limits = httpx.Limits(
+            max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+        )
+        # HTTPTransport only retries failed connects, which never reach the server
+        return httpx.Client(
+            headers=self._base_headers,
+            timeout=30,
+            transport=httpx.HTTPTransport(http2=True, limits=limits, retries=3),
+        )
+
+    @staticmethod
+    def _as_requests_response(response) -> requests.Response:
+        # lets httpx failures raise the same requests.HTTPError, with a usable .response
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        converted.reason = response.reason_phrase
+        converted.url = str(response.url)
+        converted.headers = CaseInsensitiveDict(response.headers)
+        converted._content = response.content
+        return converted
+
+    def _mount_adapter(self, pool_maxsize: int) -> None:
+        self._pool_maxsize = pool_maxsize
+        # every RPC is a POST and may be a write, so only retry when the server cannot
+        # have run it: failed connects and 503s. Read errors are never retried because
+        # the request body may already have been processed, and read=False re-raises
+        # them as they are so a read timeout is still a requests.ReadTimeout.
+        retries = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.1,
+            status_forcelist=(503,),
+            allowed_methods=frozenset(["POST"]),
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retries
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _send(
-        self, message: RequestMessage, operation: str, bypass: bool = False
+        self,
+        message: RequestMessage,
+        operation: str,
+        bypass: bool = False,
+        _decode=decode_stream,
+        _reader=io.BufferedReader,
     ) -> dict[str, Any]:
+        # _decode and _reader are bound as defaults so the hot path uses fast locals
         data = message.WS_CBOR_DESCRIPTOR
-        url = f"{self.url.raw_url}/rpc"
-        headers = {
-            "Accept": "application/cbor",
-            "Content-Type": "application/cbor",
-        }
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        if self.namespace:
-            headers["Surreal-NS"] = self.namespace
-        if self.database:
-            headers["Surreal-DB"] = self.database
-
-        response = requests.post(url, headers=headers, data=data, timeout=30)
-        response.raise_for_status()
-
-        raw_cbor = response.content
-        data_dict = cast(dict[str, Any], decode(raw_cbor))
+        data_dict: dict[str, Any]
+        if self._httpx:
+            try:
+                response = self._post(self._rpc_url, content=data)
+            except httpx.ConnectTimeout as error:
+                raise requests.ConnectTimeout(str(error)) from error
+            except httpx.TimeoutException as error:
+                raise requests.ReadTimeout(str(error)) from error
+            except httpx.TransportError as error:
+                raise requests.ConnectionError(str(error)) from error
+            if response.is_error:
+                self._as_requests_response(response).raise_for_status()
+            data_dict = decode(response.content)
+        else:
+            with self._post(
+                self._rpc_url, data=data, timeout=30, stream=True
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                data_dict = _decode(_reader(response.raw))
+                # drain any trailing bytes so the connection is returned to the pool
+                if not response.raw.closed:
+                    response.raw.read()
 
         if not bypass:
             self.check_response_for_error(data_dict, operation)
 
         return data_dict
 
+    def _call(self, method: RequestMethod, operation: str, **kwargs) -> Any:
+        return self._call_message(RequestMessage(method, **kwargs), operation)
+
+    def _call_message(self, message: RequestMessage, operation: str) -> Any:
+        self.id = message.id
+        response = self._send(message, operation)
+        self.check_response_for_result(response, operation)
+        return response["result"]
+
     def set_token(self, token: str) -> None:
         self.token = token
+        self.session.headers["Authorization"] = f"Bearer {token}"
 
     def authenticate(self, token: str) -> None:
-        self.token = token
+        self.set_token(token)
         message = RequestMessage(RequestMethod.AUTHENTICATE, token=token)
         self.id = message.id
         self._send(message, "authenticating")
@@ -66,18 +200,17 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
         self.id = message.id
         self._send(message, "invalidating")
         self.token = None
+        self.session.headers.pop("Authorization", None)
 
     def signup(self, vars: dict) -> str:
-        message = RequestMessage(RequestMethod.SIGN_UP, data=vars)
-        self.id = message.id
-        response = self._send(message, "signup")
-        self.check_response_for_result(response, "signup")
-        self.token = response["result"]
-        return response["result"]
+        result = self._call(RequestMethod.SIGN_UP, "signup", data=vars)
+        self.set_token(result)
+        return result
 
     def signin(self, vars: dict) -> str:
-        message = RequestMessage(
+        result = self._call(
             RequestMethod.SIGN_IN,
+            "signing in",
             username=vars.get("username"),
             password=vars.get("password"),
             access=vars.get("access"),
@@ -85,18 +218,11 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
             namespace=vars.get("namespace"),
             variables=vars.get("variables"),
         )
-        self.id = message.id
-        response = self._send(message, "signing in")
-        self.check_response_for_result(response, "signing in")
-        self.token = response["result"]
-        return str(response["result"])
+        self.set_token(result)
+        return str(result)
 
     def info(self):
-        message = RequestMessage(RequestMethod.INFO)
-        self.id = message.id
-        response = self._send(message, "getting database information")
-        self.check_response_for_result(response, "getting database information")
-        return response["result"]
+        return self._call(RequestMethod.INFO, "getting database information")
 
     def use(self, namespace: str, database: str) -> None:
         message = RequestMessage(
@@ -108,27 +234,16 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
         _ = self._send(message, "use")
         self.namespace = namespace
         self.database = database
+        self.session.headers["Surreal-NS"] = namespace
+        self.session.headers["Surreal-DB"] = database
 
     def query(self, query: str, vars: Optional[dict] = None) -> dict:
-        if vars is None:
-            vars = {}
-        for key, value in self.vars.items():
-            vars[key] = value
-        message = RequestMessage(
-            RequestMethod.QUERY,
-            query=query,
-            params=vars,
-        )
-        self.id = message.id
-        response = self._send(message, "query")
-        self.check_response_for_result(response, "query")
-        return response["result"][0]["result"]
+        params = {**self.vars, **vars} if vars else self.vars
+        result = self._call(RequestMethod.QUERY, "query", query=query, params=params)
+        return result[0]["result"]
 
     def query_raw(self, query: str, params: Optional[dict] = None) -> dict:
-        if params is None:
-            params = {}
-        for key, value in self.vars.items():
-            params[key] = value
+        params = {**self.vars, **params} if params else self.vars
         message = RequestMessage(
             RequestMethod.QUERY,
             query=query,
@@ -138,110 +253,117 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
         response = self._send(message, "query", bypass=True)
         return response
 
+    def prepare(self, query: str) -> PreparedQuery:
+        """
+        Encodes the query text once so repeated calls only encode their parameters.
+
+        Example:
+            by_name = db.prepare("SELECT * FROM person WHERE name = $name")
+            db.execute_prepared(by_name, {"name": "Tobie"})
+        """
+        return PreparedQuery(query)
+
+    def execute_prepared(
+        self, prepared: PreparedQuery, vars: Optional[dict] = None
+    ) -> dict:
+        params = {**self.vars, **vars} if vars else self.vars
+        return self._call_message(prepared(params), "query")[0]["result"]
+
+    def batch(self) -> Batch:
+        """
+        Creates a batch that sends the operations added to it as one multi-statement query.
+        """
+        return Batch(self)
+
+    def map(
+        self,
+        fn: Callable[["BlockingHttpSurrealConnection", Any], Any],
+        iterable: Iterable[Any],
+        max_workers: int = 10,
+    ) -> list[Any]:
+        """
+        Runs `fn(self, item)` for every item on a thread pool sharing this connection's session.
+
+        The session's connection pool is thread-safe, so independent reads and writes can be
+        issued concurrently. Changing connection state (`let`, `unset`, `use`, `signin`,
+        `authenticate`, ...) from `fn` is not thread-safe.
+
+        Example:
+            people = db.map(lambda conn, thing: conn.select(thing), ["person:1", "person:2"])
+
+        :param fn: (Callable) called with this connection and one item.
+        :param iterable: (Iterable) the items to process.
+        :param max_workers: (int) the number of worker threads, capped at the connection's
+            `pool_maxsize` so every worker can hold a pooled connection.
+        :return: (list) the return value of `fn` for each item, in order.
+        """
+        max_workers = min(max_workers, self._pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fn, self, item) for item in iterable]
+            return [future.result() for future in futures]
+
     def create(
         self,
         thing: Union[str, RecordID, Table],
         data: Optional[Union[Union[list[dict], dict], dict]] = None,
     ) -> Union[list[dict], dict]:
-        if isinstance(thing, str):
-            if ":" in thing:
-                buffer = thing.split(":")
-                thing = RecordID(table_name=buffer[0], identifier=buffer[1])
-        message = RequestMessage(RequestMethod.CREATE, collection=thing, data=data)
-        self.id = message.id
-        response = self._send(message, "create")
-        self.check_response_for_result(response, "create")
-        return response["result"]
+        return self._call(RequestMethod.CREATE, "create", collection=thing, data=data)
 
     def delete(self, thing: Union[str, RecordID, Table]) -> Union[list[dict], dict]:
-        message = RequestMessage(RequestMethod.DELETE, record_id=thing)
-        self.id = message.id
-        response = self._send(message, "delete")
-        self.check_response_for_result(response, "delete")
-        return response["result"]
+        return self._call(RequestMethod.DELETE, "delete", record_id=thing)
 
     def insert(
         self, table: Union[str, Table], data: Union[list[dict], dict]
     ) -> Union[list[dict], dict]:
-        message = RequestMessage(RequestMethod.INSERT, collection=table, params=data)
-        self.id = message.id
-        response = self._send(message, "insert")
-        self.check_response_for_result(response, "insert")
-        return response["result"]
+        return self._call(RequestMethod.INSERT, "insert", collection=table, params=data)
 
     def insert_relation(
         self, table: Union[str, Table], data: Union[list[dict], dict]
     ) -> Union[list[dict], dict]:
-        message = RequestMessage(
-            RequestMethod.INSERT_RELATION, table=table, params=data
+        return self._call(
+            RequestMethod.INSERT_RELATION, "insert_relation", table=table, params=data
         )
-        self.id = message.id
-        response = self._send(message, "insert_relation")
-        self.check_response_for_result(response, "insert_relation")
-        return response["result"]
 
     def let(self, key: str, value: Any) -> None:
         self.vars[key] = value
 
     def unset(self, key: str) -> None:
-        self.vars.pop(key)
+        self.vars.pop(key, None)
 
     def merge(
         self, thing: Union[str, RecordID, Table], data: Optional[dict] = None
     ) -> Union[list[dict], dict]:
-        message = RequestMessage(RequestMethod.MERGE, record_id=thing, data=data)
-        self.id = message.id
-        response = self._send(message, "merge")
-        self.check_response_for_result(response, "merge")
-        return response["result"]
+        return self._call(RequestMethod.MERGE, "merge", record_id=thing, data=data)
 
     def patch(
         self, thing: Union[str, RecordID, Table], data: Optional[list[dict]] = None
     ) -> Union[list[dict], dict]:
-        message = RequestMessage(RequestMethod.PATCH, collection=thing, params=data)
-        self.id = message.id
-        response = self._send(message, "patch")
-        self.check_response_for_result(response, "patch")
-        return response["result"]
+        return self._call(RequestMethod.PATCH, "patch", collection=thing, params=data)
 
     def select(self, thing: Union[str, RecordID, Table]) -> Union[list[dict], dict]:
-        message = RequestMessage(RequestMethod.SELECT, params=[thing])
-        self.id = message.id
-        response = self._send(message, "select")
-        self.check_response_for_result(response, "select")
-        return response["result"]
+        return self._call(RequestMethod.SELECT, "select", params=[thing])
 
     def update(
         self, thing: Union[str, RecordID, Table], data: Optional[dict] = None
     ) -> Union[list[dict], dict]:
-        message = RequestMessage(RequestMethod.UPDATE, record_id=thing, data=data)
-        self.id = message.id
-        response = self._send(message, "update")
-        self.check_response_for_result(response, "update")
-        return response["result"]
+        return self._call(RequestMethod.UPDATE, "update", record_id=thing, data=data)
 
     def version(self) -> str:
-        message = RequestMessage(RequestMethod.VERSION)
-        self.id = message.id
-        response = self._send(message, "getting database version")
-        self.check_response_for_result(response, "getting database version")
-        return response["result"]
+        return self._call(RequestMethod.VERSION, "getting database version")
 
     def upsert(
         self, thing: Union[str, RecordID, Table], data: Optional[dict] = None
     ) -> Union[list[dict], dict]:
-        message = RequestMessage(RequestMethod.UPSERT, record_id=thing, data=data)
-        self.id = message.id
-        response = self._send(message, "upsert")
-        self.check_response_for_result(response, "upsert")
-        return response["result"]
+        return self._call(RequestMethod.UPSERT, "upsert", record_id=thing, data=data)
+
+    def close(self) -> None:
+        self.session.close()
 
     def __enter__(self) -> "BlockingHttpSurrealConnection":
         """
         Synchronous context manager entry.
-        Initializes a session for HTTP requests.
+        The HTTP session is created in the constructor and reused here.
         """
-        self.session = requests.Session()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
@@ -249,5 +371,4 @@ class BlockingHttpSurrealConnection(SyncTemplate, UtilsMixin):
         Synchronous context manager exit.
         Closes the HTTP session upon exiting the context.
         """
-        if hasattr(self, "session"):
-            self.session.close()
+        self.close()
@@ -7,6 +7,8 @@ from surrealdb.data.types.table import Table
 
 
 class SyncTemplate:
+    __slots__ = ()
+
     # def connect(self, url: str, options: Optional[dict] = None) -> None:
     #     """Connects to a local or remote database endpoint.
     #
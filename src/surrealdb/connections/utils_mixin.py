@@ -1,4 +1,6 @@
 class UtilsMixin:
+    __slots__ = ()
+
     @staticmethod
     def check_response_for_error(response: dict, process: str) -> None:
         if response.get("error") is not None:
@@ -1,7 +1,10 @@
 import decimal
+import inspect
+import threading
 from datetime import datetime, timedelta, timezone
+from io import BytesIO
 
-from surrealdb.cbor2 import CBORTag, dumps, loads, shareable_encoder
+from surrealdb.cbor2 import CBOREncoder, CBORTag, load, loads, shareable_encoder
 from surrealdb.data.types import constants
 from surrealdb.data.types.datetime import IsoDateTimeWrapper
 from surrealdb.data.types.duration import Duration
@@ -19,6 +22,21 @@ from surrealdb.data.types.range import BoundExcluded, BoundIncluded, Range
 from surrealdb.data.types.record_id import RecordID
 from surrealdb.data.types.table import Table
 
+try:
+    from cbor2 import CBORDecoder as _CBORDecoder
+    from cbor2 import load as _c_load
+    from cbor2 import loads as _c_loads
+except ImportError:
+    _CBORDecoder = None  # type: ignore[misc]
+    _c_load = None
+    _c_loads = None
+
+# Only dispatch to the external cbor2 package when its C extension is in use.
+# The pure-Python build (e.g. on PyPy) is no faster than the vendored decoder.
+if _c_loads is not None and not inspect.isbuiltin(_c_loads):
+    _c_load = None
+    _c_loads = None
+
 
 @shareable_encoder
 def default_encoder(encoder, obj):
@@ -138,9 +156,39 @@ def tag_decoder(decoder, tag, shareable_index=None):
         raise BufferError("no decoder for tag", tag.tag)
 
 
+def _c_tag_decoder(first, second):
+    # cbor2 < 6 calls tag_hook(decoder, tag); cbor2 >= 6 calls tag_hook(tag, immutable)
+    tag = second if isinstance(first, _CBORDecoder) else first
+    return tag_decoder(None, tag)
+
+
+# one encoder and output buffer per thread, reused across calls to encode
+_scratch = threading.local()
+
+
 def encode(obj):
-    return dumps(obj, default=default_encoder, timezone=timezone.utc)
+    try:
+        encoder = _scratch.encoder
+    except AttributeError:
+        encoder = _scratch.encoder = CBOREncoder(
+            BytesIO(), default=default_encoder, timezone=timezone.utc
+        )
+    fp = encoder.fp
+    try:
+        encoder.encode(obj)
+        return fp.getvalue()
+    finally:
+        fp.seek(0)
+        fp.truncate()
 
 
 def decode(data):
+    if _c_loads is not None:
+        return _c_loads(data, tag_hook=_c_tag_decoder)
     return loads(data, tag_hook=tag_decoder)
+
+
+def decode_stream(fp):
+    if _c_load is not None:
+        return _c_load(fp, tag_hook=_c_tag_decoder)
+    return load(fp, tag_hook=tag_decoder)
@@ -14,7 +14,8 @@ def process_thing(thing: Union[str, RecordID, Table]) -> Union[RecordID, Table]:
     elif isinstance(thing, Table):
         return thing
     elif isinstance(thing, str):
-        if ":" in thing:
-            return RecordID.parse(thing)
+        table_name, separator, identifier = thing.partition(":")
+        if separator:
+            return RecordID(table_name, identifier)
         else:
             return Table(thing)
@@ -8,7 +8,16 @@ from surrealdb.request_message.methods import RequestMethod
 
 
 class WsCborDescriptor:
+    def __set_name__(self, owner, name) -> None:
+        self.name = name
+
     def __get__(self, obj, type=None) -> bytes:
+        encoded = self.prep(obj)
+        # cache on the instance so later reads bypass the descriptor
+        obj.__dict__[self.name] = encoded
+        return encoded
+
+    def prep(self, obj) -> bytes:
         if obj.method == RequestMethod.USE:
             return self.prep_use(obj)
         elif obj.method == RequestMethod.INFO:
@@ -0,0 +1,57 @@
+"""
+Defines a query whose CBOR encoding is built once and reused with different parameters.
+"""
+
+from typing import Optional
+
+from surrealdb.data.cbor import encode
+from surrealdb.request_message.message import RequestMessage
+from surrealdb.request_message.methods import RequestMethod
+
+# CBOR headers for a map of three pairs and an array of two items
+_MAP_OF_THREE = b"\xa3"
+_ARRAY_OF_TWO = b"\x82"
+
+
+class PreparedQuery:
+    """
+    A query RPC with the statement text encoded ahead of time. Only the parameters and the
+    message id are encoded per call.
+
+    The message is laid out as `{"method": "query", "params": [query, params], "id": id}`,
+    so the encoded bytes before `params` are constant and everything after it is the id.
+
+    Attributes:
+        query: The SurrealQL statement text.
+    """
+
+    def __init__(self, query: str) -> None:
+        """
+        The constructor for the PreparedQuery class.
+
+        :param query: (str) the SurrealQL statement text.
+        """
+        self.query = query
+        self._prefix: bytes = (
+            _MAP_OF_THREE
+            + encode("method")
+            + encode(RequestMethod.QUERY.value)
+            + encode("params")
+            + _ARRAY_OF_TWO
+            + encode(query)
+        )
+        self._id_key: bytes = encode("id")
+
+    def __call__(self, params: Optional[dict] = None) -> RequestMessage:
+        """
+        Builds a query message for the given parameters with its encoding already filled in.
+
+        :param params: (dict) the parameters bound to the query.
+        :return: (RequestMessage) a message that can be passed to `_send`.
+        """
+        params = params or dict()
+        message = RequestMessage(RequestMethod.QUERY, query=self.query, params=params)
+        message.__dict__["WS_CBOR_DESCRIPTOR"] = (
+            self._prefix + encode(params) + self._id_key + encode(message.id)
+        )
+        return message
@@ -0,0 +1,77 @@
+import pytest
+
+from surrealdb.data.types.record_id import RecordID
+
+
+@pytest.fixture(autouse=True)
+def setup_user(blocking_http_connection):
+    blocking_http_connection.query("DELETE user;")
+    yield
+    blocking_http_connection.query("DELETE user;")
+
+
+def test_batch(blocking_http_connection):
+    batch = blocking_http_connection.batch()
+    batch.create("user:tobie", {"name": "Tobie"})
+    batch.create(RecordID("user", "jaime"), {"name": "Jaime"})
+    batch.merge("user:tobie", {"enabled": True})
+    batch.select("user")
+    created, _, merged, selected = batch.execute()
+
+    assert created["id"] == RecordID("user", "tobie")
+    assert merged["enabled"] is True
+    assert len(selected) == 2
+    assert batch.statements == []
+
+
+def test_batch_context_manager(blocking_http_connection):
+    with blocking_http_connection.batch() as batch:
+        batch.create("user:tobie", {"name": "Tobie"})
+        batch.delete("user:tobie")
+        batch.query("SELECT * FROM user WHERE name = $name", {"name": "Tobie"})
+
+    created, deleted, selected = batch.results
+    assert created["name"] == "Tobie"
+    assert deleted["name"] == "Tobie"
+    assert selected == []
+
+
+def test_batch_empty(blocking_http_connection):
+    assert blocking_http_connection.batch().execute() == []
+
+
+def test_batch_update_without_data(blocking_http_connection):
+    blocking_http_connection.create("user:tobie", {"name": "Tobie"})
+    batch = blocking_http_connection.batch()
+    batch.update("user:tobie")
+    batch.upsert("user:tobie")
+    assert batch.statements == [
+        "UPDATE ONLY $_batch0_what",
+        "UPSERT ONLY $_batch1_what",
+    ]
+    updated, upserted = batch.execute()
+    assert updated["name"] == "Tobie"
+    assert upserted["name"] == "Tobie"
+
+
+def test_batch_error_clears_queue(blocking_http_connection):
+    batch = blocking_http_connection.batch()
+    batch.create("user:tobie", {"name": "Tobie"})
+    batch.query('THROW "boom"')
+    with pytest.raises(Exception, match="batch statement 1 failed"):
+        batch.execute()
+
+    assert batch.statements == []
+    assert batch.params == {}
+    assert batch.results[0]["name"] == "Tobie"
+    assert batch.execute() == []
+
+
+def test_batch_query_rejects_rebound_vars(blocking_http_connection):
+    batch = blocking_http_connection.batch()
+    batch.query("SELECT * FROM user WHERE name = $name", {"name": "Tobie"})
+    batch.query("SELECT * FROM user WHERE name = $name", {"name": "Tobie"})
+    with pytest.raises(ValueError, match=r"\$name"):
+        batch.query("SELECT * FROM user WHERE name = $name", {"name": "Jaime"})
+    assert len(batch.statements) == 2
+    assert batch.params == {"name": "Tobie"}
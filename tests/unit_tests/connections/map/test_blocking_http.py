@@ -0,0 +1,31 @@
+import pytest
+
+from surrealdb.data.types.record_id import RecordID
+
+
+@pytest.fixture(autouse=True)
+def setup_user(blocking_http_connection):
+    blocking_http_connection.query("DELETE user;")
+    yield
+    blocking_http_connection.query("DELETE user;")
+
+
+def test_map(blocking_http_connection):
+    outcome = blocking_http_connection.map(
+        lambda connection, num: connection.create(RecordID("user", num), {"num": num}),
+        range(20),
+        max_workers=4,
+    )
+    assert [record["num"] for record in outcome] == list(range(20))
+    assert len(blocking_http_connection.query("SELECT * FROM user;")) == 20
+
+
+def test_map_caps_workers_at_pool_size(blocking_http_connection):
+    adapter = blocking_http_connection.session.get_adapter("http://")
+    outcome = blocking_http_connection.map(
+        lambda connection, num: connection.query("RETURN $num", {"num": num}),
+        range(5),
+        max_workers=40,
+    )
+    assert outcome == list(range(5))
+    assert blocking_http_connection.session.get_adapter("http://") is adapter
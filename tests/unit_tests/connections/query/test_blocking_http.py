@@ -50,3 +50,24 @@ def test_query(blocking_http_connection):
         },
     ]
     blocking_http_connection.query("DELETE user;")
+
+
+def test_query_vars_not_mutated(blocking_http_connection):
+    blocking_http_connection.let("name", "Tobie")
+    vars = {"age": 3}
+    outcome = blocking_http_connection.query("RETURN [$name, $age]", vars)
+    assert outcome == ["Tobie", 3]
+    assert vars == {"age": 3}
+
+    outcome = blocking_http_connection.query("RETURN $name", {"name": "Jaime"})
+    assert outcome == "Jaime"
+    blocking_http_connection.unset("name")
+
+
+def test_execute_prepared(blocking_http_connection):
+    prepared = blocking_http_connection.prepare("RETURN $num * 2")
+    outcomes = [
+        blocking_http_connection.execute_prepared(prepared, {"num": num})
+        for num in range(3)
+    ]
+    assert outcomes == [0, 2, 4]
@@ -0,0 +1,136 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from surrealdb.connections.blocking_http import BlockingHttpSurrealConnection
+from surrealdb.data.cbor import encode
+
+
+class DropAfterBodyHandler(BaseHTTPRequestHandler):
+    """Reads the request body and then drops the socket without answering."""
+
+    protocol_version = "HTTP/1.1"
+    posts = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        type(self).posts += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.connection.shutdown(socket.SHUT_RDWR)
+        self.close_connection = True
+
+
+class UnavailableOnceHandler(DropAfterBodyHandler):
+    """Answers the first request with a long-delayed 503 and every later one with a result."""
+
+    def do_POST(self):
+        type(self).posts += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if type(self).posts == 1:
+            self.send_response(503)
+            self.send_header("Retry-After", "60")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = encode({"id": "1", "result": "2.0.0"})
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SlowHandler(DropAfterBodyHandler):
+    """Reads the request body and waits longer than the client is willing to."""
+
+    def do_POST(self):
+        type(self).posts += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(1)
+        self.close_connection = True
+
+
+@pytest.fixture
+def server(request):
+    handler = request.param
+    handler.posts = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.parametrize("server", [DropAfterBodyHandler], indirect=True)
+def test_write_is_not_resent_after_read_error(server):
+    connection = BlockingHttpSurrealConnection(f"http://127.0.0.1:{server.server_port}")
+    with pytest.raises(requests.ConnectionError):
+        connection.create("person:tobie", {"name": "Tobie"})
+    connection.close()
+    assert DropAfterBodyHandler.posts == 1
+
+
+@pytest.mark.parametrize("server", [SlowHandler], indirect=True)
+def test_read_timeout_is_raised_as_timeout(server):
+    connection = BlockingHttpSurrealConnection(f"http://127.0.0.1:{server.server_port}")
+    post = connection._post
+    connection._post = lambda url, **kwargs: post(url, **{**kwargs, "timeout": 0.2})
+    with pytest.raises(requests.ReadTimeout):
+        connection.create("person:tobie", {"name": "Tobie"})
+    connection.close()
+    assert SlowHandler.posts == 1
+
+
+@pytest.mark.parametrize("server", [UnavailableOnceHandler], indirect=True)
+def test_service_unavailable_is_retried(server):
+    connection = BlockingHttpSurrealConnection(f"http://127.0.0.1:{server.server_port}")
+    started = time.monotonic()
+    assert connection.version() == "2.0.0"
+    # the Retry-After header is ignored so a retry never outlasts the request timeout
+    assert time.monotonic() - started < 5
+    connection.close()
+    assert UnavailableOnceHandler.posts == 2
+
+
+@pytest.mark.parametrize("server", [DropAfterBodyHandler], indirect=True)
+def test_httpx_write_is_not_resent_after_read_error(server):
+    pytest.importorskip("httpx")
+    connection = BlockingHttpSurrealConnection(
+        f"http://127.0.0.1:{server.server_port}", transport="httpx"
+    )
+    with pytest.raises(requests.ConnectionError):
+        connection.create("person:tobie", {"name": "Tobie"})
+    connection.close()
+    assert DropAfterBodyHandler.posts == 1
+
+
+@pytest.mark.parametrize("server", [UnavailableOnceHandler], indirect=True)
+def test_httpx_status_error_is_a_requests_error(server):
+    pytest.importorskip("httpx")
+    connection = BlockingHttpSurrealConnection(
+        f"http://127.0.0.1:{server.server_port}", transport="httpx"
+    )
+    with pytest.raises(requests.HTTPError, match="503 Server Error") as error:
+        connection.version()
+    connection.close()
+    assert error.value.response.status_code == 503
+    assert UnavailableOnceHandler.posts == 1
+
+
+@pytest.mark.parametrize("server", [SlowHandler], indirect=True)
+def test_httpx_read_timeout_is_raised_as_timeout(server):
+    httpx = pytest.importorskip("httpx")
+    connection = BlockingHttpSurrealConnection(
+        f"http://127.0.0.1:{server.server_port}", transport="httpx"
+    )
+    connection.session.timeout = httpx.Timeout(0.2)
+    with pytest.raises(requests.ReadTimeout):
+        connection.create("person:tobie", {"name": "Tobie"})
+    connection.close()
+    assert SlowHandler.posts == 1
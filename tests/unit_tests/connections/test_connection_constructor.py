@@ -1,3 +1,5 @@
+import weakref
+
 import pytest
 
 from surrealdb import (
@@ -39,3 +41,28 @@ def test_async___init__(test_data):
     assert type(outcome) == AsyncWsSurrealConnection
     outcome = AsyncSurreal("http://localhost:5000")
     assert type(outcome) == AsyncHttpSurrealConnection
+
+
+def test_blocking_http_transport():
+    with pytest.raises(ValueError, match="Unsupported transport"):
+        BlockingHttpSurrealConnection("http://localhost:5000", transport="curl")
+
+
+def test_blocking_http_httpx_transport():
+    httpx = pytest.importorskip("httpx")
+    outcome = BlockingHttpSurrealConnection("http://localhost:5000", transport="httpx")
+    assert isinstance(outcome.session, httpx.Client)
+    outcome.close()
+
+
+def test_blocking_http_slots():
+    outcome = BlockingHttpSurrealConnection("http://localhost:5000")
+    assert not hasattr(outcome, "__dict__")
+    assert weakref.ref(outcome)() is outcome
+    outcome.close()
+
+
+def test_blocking_http_pool_maxsize():
+    outcome = BlockingHttpSurrealConnection("http://localhost:5000", pool_maxsize=4)
+    assert outcome.session.get_adapter("http://")._pool_maxsize == 4
+    outcome.close()
@@ -27,3 +27,8 @@ def test_unset(blocking_http_connection):
     assert outcome == []
 
     blocking_http_connection.query("DELETE person;")
+
+
+def test_unset_missing_key(blocking_http_connection):
+    blocking_http_connection.unset(key="missing")
+    assert "missing" not in blocking_http_connection.vars
@@ -2,7 +2,12 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from surrealdb.data.cbor import decode, encode
+from surrealdb.cbor2 import loads
+from surrealdb.data import cbor
+from surrealdb.data.cbor import decode, encode, tag_decoder
+from surrealdb.data.types.geometry import GeometryPoint
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.data.types.table import Table
 
 
 # Test roundtrip for basic types
@@ -63,3 +68,23 @@ def test_cbor_roundtrip_empty_list(val):
 @given(st.just({}))
 def test_cbor_roundtrip_empty_dict(val):
     assert decode(encode(val)) == val
+
+
+# SurrealDB tags decode the same through the cbor2 C extension as through the vendored decoder
+def test_cbor_decode_matches_vendored_decoder():
+    pytest.importorskip("cbor2")
+    assert cbor._c_loads is not None
+    payload = {
+        "id": RecordID("person", "tobie"),
+        "table": Table("person"),
+        "point": GeometryPoint(1.5, 2.5),
+        "empty": None,
+    }
+    raw = encode(payload)
+    assert repr(decode(raw)) == repr(loads(raw, tag_hook=tag_decoder))
+
+
+def test_cbor_encode_after_failure():
+    with pytest.raises(Exception):
+        encode({"bad": object()})
+    assert decode(encode({"good": 1})) == {"good": 1}
@@ -0,0 +1,27 @@
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.data.types.table import Table
+from surrealdb.data.utils import process_thing
+
+
+def test_process_thing_table():
+    assert process_thing("person") == Table("person")
+
+
+def test_process_thing_record_id():
+    outcome = process_thing("person:tobie")
+    assert isinstance(outcome, RecordID)
+    assert outcome.table_name == "person"
+    assert outcome.id == "tobie"
+
+
+def test_process_thing_record_id_with_colon():
+    outcome = process_thing("person:a:b")
+    assert outcome.table_name == "person"
+    assert outcome.id == "a:b"
+
+
+def test_process_thing_passthrough():
+    record_id = RecordID("person", 1)
+    table = Table("person")
+    assert process_thing(record_id) is record_id
+    assert process_thing(table) is table
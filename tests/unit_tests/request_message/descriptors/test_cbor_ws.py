@@ -194,3 +194,10 @@ def test_delete_pass():
     )
     outcome = message.WS_CBOR_DESCRIPTOR
     assert isinstance(outcome, bytes)
+
+
+def test_encoding_is_cached():
+    message = RequestMessage(RequestMethod.SELECT, params=["person"])
+    outcome = message.WS_CBOR_DESCRIPTOR
+    assert message.WS_CBOR_DESCRIPTOR is outcome
+    assert message.__dict__["WS_CBOR_DESCRIPTOR"] is outcome
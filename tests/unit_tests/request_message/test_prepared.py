@@ -0,0 +1,24 @@
+from surrealdb.data.cbor import decode
+from surrealdb.data.types.record_id import RecordID
+from surrealdb.request_message.message import RequestMessage
+from surrealdb.request_message.methods import RequestMethod
+from surrealdb.request_message.prepared import PreparedQuery
+
+
+def test_prepared_query_matches_request_message():
+    query = "SELECT * FROM person WHERE id = $id"
+    params = {"id": RecordID("person", "tobie")}
+    message = PreparedQuery(query)(params)
+    expected = RequestMessage(RequestMethod.QUERY, query=query, params=params)
+    expected.id = message.id
+
+    assert decode(message.WS_CBOR_DESCRIPTOR) == decode(expected.WS_CBOR_DESCRIPTOR)
+
+
+def test_prepared_query_without_params():
+    message = PreparedQuery("RETURN 1")()
+    assert decode(message.WS_CBOR_DESCRIPTOR) == {
+        "method": "query",
+        "params": ["RETURN 1", {}],
+        "id": message.id,
+    }